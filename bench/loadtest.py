@@ -0,0 +1,243 @@
+"""HTTP load test for the gunicorn deployment.
+
+Starts `gunicorn app:app` locally for each worker/thread setting, replays a
+weighted mix of the main routes from many concurrent clients and reports
+throughput, error rate and p50/p95/p99 latency. Everything runs on
+127.0.0.1, so it works offline.
+
+    # real database, default mix, compare three settings
+    python bench/loadtest.py --configs 1x1,2x4,4x8
+
+    # no database needed (built, migrated and given coverage in a temp dir, removed afterwards)
+    python bench/loadtest.py --synthetic --concurrency 32 --duration 30
+
+    # add Date_Key and coverage to your own database first, as a deployment would
+    python bench/loadtest.py --db /tmp/Climate_Data.db --prepare
+
+    # hit a server you started yourself
+    python bench/loadtest.py --url http://127.0.0.1:5001
+"""
+import argparse
+import os
+import random
+import shutil
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from synthetic_db import build_synthetic_db
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MIX = 'home=30,data=20,metrics=20,similarity=20,download=10'
+METRICS = ['rain', 'rain_days', 'temp', 'highest_temp']
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        route, _, weight = part.partition('=')
+        mix[route.strip()] = float(weight or 1)
+    unknown = set(mix) - {'home', 'data', 'metrics', 'similarity', 'download'}
+    if unknown:
+        raise SystemExit(f"Unknown route(s) in --mix: {', '.join(sorted(unknown))}")
+    return mix
+
+
+def load_station_ids(db_path):
+    try:
+        conn = sqlite3.connect(db_path)
+        ids = [str(row[0]) for row in conn.execute("SELECT site_id FROM weather_station")]
+        conn.close()
+        return ids or ['0']
+    except sqlite3.Error:
+        return ['0']
+
+
+def build_path(route, rng, station_ids):
+    if route == 'home':
+        return '/'
+    if route == 'data':
+        return '/?page=data'
+    if route == 'metrics':
+        return f'/?page=metrics&metric={rng.choice(METRICS)}'
+    if route == 'similarity':
+        return f'/?page=similarity&target_loc={rng.choice(station_ids)}'
+    return '/download?temp=on&rain=on'
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return float('nan')
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def prepare_db(db_path):
+    """Run the same one-off scripts a deployment runs, so the load hits the indexed
+    Date_Key path and real coverage bitmaps rather than the unmigrated fallbacks."""
+    env = dict(os.environ, CLIMATE_DB=db_path)
+    for script in ('migrate_dates.py', 'build_coverage.py'):
+        print(f"Running {script} ...")
+        subprocess.run([sys.executable, script], cwd=ROOT, env=env, check=True)
+
+
+def start_gunicorn(port, workers, threads, db_path):
+    env = dict(os.environ, CLIMATE_DB=db_path)
+    cmd = [sys.executable, '-m', 'gunicorn', 'app:app', '--bind', f'127.0.0.1:{port}',
+           '--workers', str(workers), '--threads', str(threads), '--timeout', '120', '--log-level', 'warning']
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env)
+
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise SystemExit(f"gunicorn exited with code {proc.returncode}")
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise SystemExit("gunicorn did not start within 60s")
+
+
+def run_load(base_url, mix, concurrency, duration, warmup, station_ids, timeout, seed):
+    routes, weights = list(mix), list(mix.values())
+    results = []  # (route, seconds, ok) - list.append is thread-safe
+    stop_at = [0.0]
+    record_from = [0.0]
+
+    def client(worker_id):
+        rng = random.Random(seed + worker_id)
+        while time.perf_counter() < stop_at[0]:
+            route = rng.choices(routes, weights)[0]
+            url = base_url + build_path(route, rng, station_ids)
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(url, timeout=timeout) as resp:
+                    resp.read()
+                    ok = resp.status < 400
+            except (urllib.error.URLError, OSError):
+                ok = False
+            if started >= record_from[0]:
+                results.append((route, time.perf_counter() - started, ok))
+
+    now = time.perf_counter()
+    record_from[0] = now + warmup
+    stop_at[0] = now + warmup + duration
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def summarise(results, duration):
+    def stats(rows):
+        latencies = sorted(r[1] for r in rows)
+        errors = sum(1 for r in rows if not r[2])
+        return {
+            'requests': len(rows),
+            'rps': len(rows) / duration,
+            'error_rate': errors / len(rows) if rows else 0.0,
+            'p50': percentile(latencies, 50) * 1000,
+            'p95': percentile(latencies, 95) * 1000,
+            'p99': percentile(latencies, 99) * 1000,
+        }
+
+    by_route = {}
+    for row in results:
+        by_route.setdefault(row[0], []).append(row)
+    return stats(results), {route: stats(rows) for route, rows in sorted(by_route.items())}
+
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    print(f"{'':<14}{'requests':>9}{'req/s':>9}{'errors':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for label, s in rows:
+        print(f"{label:<14}{s['requests']:>9}{s['rps']:>9.1f}{s['error_rate']:>8.1%} "
+              f"{s['p50']:>8.1f}{s['p95']:>9.1f}{s['p99']:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--configs', default='1x1,2x1,2x4',
+                        help='comma-separated WORKERSxTHREADS gunicorn settings to compare (default: %(default)s)')
+    parser.add_argument('--url', help='load an already-running server instead of starting gunicorn')
+    parser.add_argument('--db', default=os.path.join(ROOT, 'Climate_Data.db'), help='database to serve')
+    parser.add_argument('--synthetic', action='store_true',
+                        help='generate, migrate and build coverage for a synthetic database in a temp dir and serve that')
+    parser.add_argument('--prepare', action='store_true',
+                        help='run migrate_dates.py and build_coverage.py on --db before loading (always done for --synthetic)')
+    parser.add_argument('--stations', type=int, default=10, help='stations per state for --synthetic')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='route weights (default: %(default)s)')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=20, help='measured seconds per config')
+    parser.add_argument('--warmup', type=float, default=3, help='unmeasured seconds before each run')
+    parser.add_argument('--timeout', type=float, default=60, help='per-request timeout in seconds')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    db_path = args.db
+    temp_dir = None
+    try:
+        if args.synthetic:
+            temp_dir = tempfile.mkdtemp(prefix='climate_loadtest_')
+            db_path = os.path.join(temp_dir, 'Climate_Data.db')
+            print(f"Building synthetic database at {db_path} ...")
+            build_synthetic_db(db_path, stations_per_state=args.stations)
+        if args.synthetic or args.prepare:
+            prepare_db(db_path)
+        run_configs(args, mix, db_path)
+    finally:
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def run_configs(args, mix, db_path):
+    station_ids = load_station_ids(db_path)
+
+    print(f"Mix: {args.mix} | concurrency {args.concurrency} | {args.duration:g}s per run")
+    if args.url:
+        results = run_load(args.url.rstrip('/'), mix, args.concurrency, args.duration, args.warmup,
+                           station_ids, args.timeout, args.seed)
+        overall, per_route = summarise(results, args.duration)
+        print_table(args.url, [('all', overall)] + list(per_route.items()))
+        return
+
+    comparison = []
+    for config in args.configs.split(','):
+        workers, _, threads = config.strip().partition('x')
+        workers, threads = int(workers), int(threads or 1)
+        port = free_port()
+        proc = start_gunicorn(port, workers, threads, db_path)
+        try:
+            results = run_load(f'http://127.0.0.1:{port}', mix, args.concurrency, args.duration, args.warmup,
+                               station_ids, args.timeout, args.seed)
+        finally:
+            proc.terminate()
+            proc.wait()
+        overall, per_route = summarise(results, args.duration)
+        print_table(f"{workers} worker(s) x {threads} thread(s)", [('all', overall)] + list(per_route.items()))
+        comparison.append((f"{workers}x{threads}", overall))
+
+    if len(comparison) > 1:
+        print_table("Comparison (workers x threads)", comparison)
+
+
+if __name__ == '__main__':
+    main()
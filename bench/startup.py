@@ -0,0 +1,141 @@
+"""Cold-start benchmark: import time of the app and first-byte latency after a restart.
+
+Each measurement runs in a fresh process, the way a sleeping dyno wakes up:
+
+  * import      - wall time of `import app` in a new interpreter
+  * lazy check  - whether pandas/NumPy are still unloaded after serving the static pages
+  * first byte  - time from launching `gunicorn app:app` to the first byte of the
+                  first response, per path (a new server for every sample)
+
+    python bench/startup.py
+    python bench/startup.py --runs 10 --paths "/,/?page=about,/?page=data" --json >> bench_output.txt
+"""
+import argparse
+import http.client
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from loadtest import ROOT, free_port
+
+STATIC_PATHS = ['/', '/?page=home', '/?page=about', '/?page=export']
+
+IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import app
+print(time.perf_counter() - started)
+"""
+
+LAZY_SNIPPET = """
+import json, sys
+import app
+client = app.app.test_client()
+for path in {paths!r}:
+    client.get(path)
+print(json.dumps({{name: name in sys.modules for name in ('pandas', 'numpy')}}))
+"""
+
+
+def run_python(snippet, env):
+    result = subprocess.run([sys.executable, '-c', snippet], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip().splitlines()[-1]
+
+
+def slowest_imports(env, top=10):
+    """Top packages by cumulative import time while importing app, from python -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    by_package = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        # A package's outermost import already includes everything beneath it
+        by_package[package] = max(by_package.get(package, 0), int(cumulative) / 1000)
+    by_package.pop('app', None)
+    return sorted(((ms, name) for name, ms in by_package.items()), reverse=True)[:top]
+
+
+def first_byte(path, env, server):
+    port = free_port()
+    if server == 'gunicorn':
+        cmd = [sys.executable, '-m', 'gunicorn', 'app:app', '--bind', f'127.0.0.1:{port}',
+               '--workers', '1', '--log-level', 'warning']
+    else:
+        cmd = [sys.executable, '-c', f"import app; app.app.run(port={port})"]
+
+    started = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            if proc.poll() is not None:
+                raise SystemExit(f"{server} exited with code {proc.returncode}")
+            if time.perf_counter() - started > 120:
+                raise SystemExit(f"{server} did not answer within 120s")
+            try:
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+                conn.request('GET', path)
+                response = conn.getresponse()  # returns once the status line has arrived
+                elapsed = time.perf_counter() - started
+                response.read()
+                conn.close()
+                return elapsed
+            except (ConnectionRefusedError, socket.timeout, http.client.RemoteDisconnected):
+                time.sleep(0.01)
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per measurement')
+    parser.add_argument('--paths', default='/,/?page=about,/?page=data', help='comma-separated paths for first-byte timing')
+    parser.add_argument('--server', choices=['gunicorn', 'flask'], default='gunicorn')
+    parser.add_argument('--db', help='database to serve (defaults to the app\'s own)')
+    parser.add_argument('--json', action='store_true', help='print one JSON line instead of a table, for tracking over time')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.db:
+        env['CLIMATE_DB'] = os.path.abspath(args.db)
+
+    import_times = [float(run_python(IMPORT_SNIPPET, env)) * 1000 for _ in range(args.runs)]
+    lazy = json.loads(run_python(LAZY_SNIPPET.format(paths=STATIC_PATHS), env))
+    paths = [p.strip() for p in args.paths.split(',') if p.strip()]
+    ttfb = {path: [first_byte(path, env, args.server) * 1000 for _ in range(args.runs)] for path in paths}
+
+    report = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'runs': args.runs,
+        'import_ms': round(statistics.median(import_times), 1),
+        'static_pages_load_pandas': lazy['pandas'],
+        'static_pages_load_numpy': lazy['numpy'],
+        'first_byte_ms': {path: round(statistics.median(times), 1) for path, times in ttfb.items()},
+    }
+    if args.json:
+        print(json.dumps(report))
+        return
+
+    print(f"import app            median {report['import_ms']:.1f} ms over {args.runs} runs "
+          f"(min {min(import_times):.1f}, max {max(import_times):.1f})")
+    print(f"static pages import   pandas: {'yes' if lazy['pandas'] else 'no'}, numpy: {'yes' if lazy['numpy'] else 'no'}")
+    print("\nslowest packages imported by app (cumulative ms)")
+    for ms, name in slowest_imports(env):
+        print(f"  {ms:8.1f}  {name}")
+    print(f"\nfirst byte after cold start ({args.server}, median of {args.runs})")
+    for path, ms in report['first_byte_ms'].items():
+        print(f"  {ms:8.1f} ms  {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""Builds a synthetic Climate_Data.db with the same tables and columns as the real one.
+
+Handy for benchmarking offline or when the real database (stored in Git LFS)
+hasn't been pulled.
+
+    python bench/synthetic_db.py /tmp/Climate_Data.db --stations 10 --years 50
+"""
+import argparse
+import datetime
+import math
+import os
+import random
+import sqlite3
+
+STATES = ['VIC', 'NSW', 'QLD', 'WA', 'SA', 'TAS', 'NT']
+
+
+def build_synthetic_db(path, stations_per_state=10, years=50, seed=42):
+    if os.path.exists(path):
+        os.remove(path)
+    rng = random.Random(seed)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE weather_station (site_id INTEGER, name TEXT)")
+
+    first_day = datetime.date(2020 - years + 1, 1, 1)
+    n_days = (datetime.date(2020, 12, 31) - first_day).days + 1
+    date_strings = [(first_day + datetime.timedelta(days=i)).strftime('%d/%m/%Y') for i in range(n_days)]
+
+    site_id = 10000
+    for state in STATES:
+        conn.execute(f"CREATE TABLE {state} (Location INTEGER, DMY TEXT, MaxTemp REAL, Precipitation REAL)")
+        for _ in range(stations_per_state):
+            site_id += 1
+            conn.execute("INSERT INTO weather_station VALUES (?, ?)", (site_id, f"SYNTHETIC STATION {site_id}"))
+
+            # Stations open at different times so record lengths vary like the real data
+            start = rng.randrange(0, max(1, n_days - 730))
+            base_temp = rng.uniform(18, 32)
+            rows = []
+            for i in range(start, n_days):
+                season = 6 * math.cos(2 * math.pi * (i % 365) / 365)
+                temp = None if rng.random() < 0.05 else round(base_temp + season + rng.gauss(0, 3), 1)
+                rain = round(rng.expovariate(0.2), 1) if rng.random() < 0.3 else 0.0
+                rows.append((site_id, date_strings[i], temp, rain))
+            conn.executemany(f"INSERT INTO {state} VALUES (?, ?, ?, ?)", rows)
+
+    conn.commit()
+    conn.close()
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path')
+    parser.add_argument('--stations', type=int, default=10, help='stations per state')
+    parser.add_argument('--years', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    build_synthetic_db(args.path, args.stations, args.years, args.seed)
+    print(f"Wrote {args.path}")
@@ -0,0 +1,14 @@
+"""Precompute the per-station data-coverage bitmaps into the station_coverage table.
+
+Run once after loading or updating Climate_Data.db:
+
+    python build_coverage.py
+"""
+import time
+
+from climate.coverage import build_coverage_bitmaps
+
+if __name__ == '__main__':
+    started = time.perf_counter()
+    count = build_coverage_bitmaps()
+    print(f"Built coverage bitmaps for {count} stations in {time.perf_counter() - started:.1f}s")
@@ -0,0 +1,32 @@
+"""Australian Climate Analytics web app.
+
+This module is the lightweight routing core: it only needs Flask, so the home,
+about and export pages are served without ever importing pandas or NumPy. The
+analytics modules (data, compare, coverage, export, views) are imported inside
+the routes that need them, the first time they are hit.
+"""
+from flask import Flask, request
+
+from climate.pages import get_page_html
+
+app = Flask(__name__)
+
+
+@app.route('/download')
+def download_data():
+    from climate.export import download_csv
+    return download_csv()
+
+@app.route('/compare')
+def compare_stations():
+    from climate.compare import compare_json
+    return compare_json()
+
+@app.route('/coverage')
+def coverage_report():
+    from climate.coverage import coverage_json
+    return coverage_json()
+
+@app.route('/')
+def home():
+    return get_page_html(request.args)
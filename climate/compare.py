@@ -0,0 +1,158 @@
+"""Vectorised multi-station comparison: aligned series, anomalies and blocked pairwise matrices."""
+from flask import request, jsonify
+import pandas as pd
+import numpy as np
+
+from climate.db import STATES, PeriodError, get_db_connection, date_range_sql, read_period
+from climate.data import parse_dmy, get_station_names
+from climate.coverage import read_coverage_filter, coverage_filtered_ids, coverage_available
+
+
+# --- 2b. STATION COMPARISON ---
+def get_state_series(state, station_ids=None, column='MaxTemp', start=None, end=None):
+    """Fetch every station's daily series for a state in ONE query and align them
+    into a (days x stations) float32 matrix. Missing station-days are NaN."""
+    if state not in STATES or column not in ('MaxTemp', 'Precipitation'):
+        return None, [], []
+
+    query = f"""
+    SELECT CAST(Location AS TEXT) as Station_ID, DMY as Date, {column} as Value
+    FROM {state}
+    WHERE {column} IS NOT NULL AND Location IS NOT NULL AND DMY IS NOT NULL
+    """
+    params = []
+    if station_ids:
+        query += f" AND CAST(Location AS TEXT) IN ({', '.join('?' * len(station_ids))})"
+        params = [str(sid) for sid in station_ids]
+
+    conn = get_db_connection()
+    try:
+        period_sql, period_params = date_range_sql(conn, state, start, end)
+    except PeriodError:
+        conn.close()
+        raise
+    try:
+        df = pd.read_sql_query(query + period_sql, conn, params=params + period_params)
+        conn.close()
+    except Exception as e:
+        print(f"Error loading series for {state}: {e}")
+        return None, [], []
+    if df.empty:
+        return None, [], []
+
+    row_dates = parse_dmy(df['Date'])
+    ok = ~pd.isna(row_dates)
+
+    station_codes, station_list = pd.factorize(df['Station_ID'])
+    days = np.unique(row_dates[ok])
+    day_index = np.searchsorted(days, row_dates[ok])
+
+    matrix = np.full((len(days), len(station_list)), np.nan, dtype=np.float32)
+    matrix[day_index, station_codes[ok]] = df['Value'].values[ok]
+    return matrix, pd.DatetimeIndex(days), list(station_list)
+
+def daily_anomalies(matrix, days):
+    """Subtract each station's own day-of-year climatology so the seasonal cycle
+    doesn't dominate every correlation."""
+    doy = days.dayofyear.values - 1
+    present = ~np.isnan(matrix)
+    sums = np.zeros((366, matrix.shape[1]), dtype=np.float64)
+    counts = np.zeros((366, matrix.shape[1]), dtype=np.float64)
+    np.add.at(sums, doy, np.where(present, matrix, 0.0))
+    np.add.at(counts, doy, present)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        climatology = sums / counts
+    return (matrix - climatology[doy]).astype(np.float32)
+
+def pairwise_matrix(anomalies, metric='corr', block_size=128, min_overlap=365):
+    """Pairwise correlation (or RMS anomaly distance) between every pair of columns,
+    using only the days both stations reported.
+
+    Works on column blocks so the temporaries stay at (days x block_size) no matter
+    how many stations are compared; each block pair is a handful of matrix products."""
+    present = ~np.isnan(anomalies)
+    values = np.where(present, anomalies, 0.0).astype(np.float32)
+    mask = present.astype(np.float32)
+    n_stations = anomalies.shape[1]
+    result = np.full((n_stations, n_stations), np.nan)
+
+    for i0 in range(0, n_stations, block_size):
+        i1 = min(i0 + block_size, n_stations)
+        xi = values[:, i0:i1].astype(np.float64)
+        mi = mask[:, i0:i1].astype(np.float64)
+        xi2 = xi * xi
+        for j0 in range(i0, n_stations, block_size):
+            j1 = min(j0 + block_size, n_stations)
+            xj = values[:, j0:j1].astype(np.float64)
+            mj = mask[:, j0:j1].astype(np.float64)
+
+            overlap = mi.T @ mj
+            sum_xy = xi.T @ xj
+            sum_x, sum_y = xi.T @ mj, mi.T @ xj
+            sum_xx, sum_yy = xi2.T @ mj, mi.T @ (xj * xj)
+
+            with np.errstate(invalid='ignore', divide='ignore'):
+                if metric == 'dist':
+                    block = np.sqrt(np.maximum(sum_xx + sum_yy - 2 * sum_xy, 0) / overlap)
+                else:
+                    cov = overlap * sum_xy - sum_x * sum_y
+                    var_x = overlap * sum_xx - sum_x ** 2
+                    var_y = overlap * sum_yy - sum_y ** 2
+                    block = cov / np.sqrt(var_x * var_y)
+            block[overlap < min_overlap] = np.nan
+
+            result[i0:i1, j0:j1] = block
+            result[j0:j1, i0:i1] = block.T
+
+    np.fill_diagonal(result, 0.0 if metric == 'dist' else 1.0)
+    return result
+
+def get_station_comparison(state, station_ids=None, metric='corr', start=None, end=None):
+    matrix, days, stations = get_state_series(state, station_ids, start=start, end=end)
+    if matrix is None or len(stations) < 2:
+        return None, []
+    # A day-of-year climatology needs each day seen at least twice - over a shorter span it
+    # equals the data itself and the anomalies are all zero, so compare the raw values instead
+    if (days[-1] - days[0]).days >= 2 * 365:
+        matrix = daily_anomalies(matrix, days)
+    # A year of shared days, or half the period's days when the period is shorter than that
+    min_overlap = max(3, min(365, len(days) // 2))
+    result = pairwise_matrix(matrix, metric=metric, min_overlap=min_overlap)
+    return result, stations
+
+def has_comparable_pairs(result):
+    """False when every pair of different stations came out NaN (not enough shared days)."""
+    return bool(np.isfinite(result[~np.eye(len(result), dtype=bool)]).any())
+
+
+def compare_json():
+    """Body of the /compare route: the comparison matrix as JSON."""
+    state = request.args.get('state', '').strip().upper()
+    metric = request.args.get('metric', 'corr')
+    station_ids = [s.strip() for s in request.args.get('stations', '').split(',') if s.strip()]
+
+    if state not in STATES:
+        return jsonify({'error': f"Unknown state '{state}'"}), 400
+
+    coverage_filter = read_coverage_filter(request.args)
+    if coverage_filter and not coverage_available():
+        return jsonify({'error': "Coverage filter requested but coverage hasn't been built - run build_coverage.py."}), 503
+    station_ids = coverage_filtered_ids(state, station_ids, coverage_filter)
+    try:
+        result, stations = get_station_comparison(state, station_ids, metric, *read_period(request.args))
+    except PeriodError as e:
+        return jsonify({'error': str(e)}), 400
+    if result is None:
+        return jsonify({'error': f"Not enough station data in {state} to compare."}), 404
+    if not has_comparable_pairs(result):
+        return jsonify({'error': "Period too short to compare - no two stations share enough days in it."}), 404
+
+    name_map = get_station_names()
+    # NaN isn't valid JSON, so pairs without enough overlapping days become null
+    matrix = np.where(np.isnan(result), None, np.round(result, 4)).tolist()
+    return jsonify({
+        'state': state,
+        'metric': 'dist' if metric == 'dist' else 'corr',
+        'stations': [{'id': sid, 'name': name_map.get(sid, sid).title()} for sid in stations],
+        'matrix': matrix
+    })
@@ -0,0 +1,289 @@
+"""Per-station data-coverage bitmaps and the coverage filter used across the pages."""
+import sqlite3
+import threading
+from flask import request, jsonify
+import pandas as pd
+import numpy as np
+
+from climate.db import STATES, get_db_connection
+from climate.data import parse_dmy
+
+
+# --- 2c. DATA COVERAGE BITMAPS ---
+# One bit per station-day (1 = a reading exists) for MaxTemp and Precipitation, packed
+# 8 days to a byte. Built into the station_coverage table by build_coverage.py. Requests
+# only ever read that table - if it hasn't been built, coverage is simply unavailable.
+COVERAGE_METRICS = {'MaxTemp': 'MaxTemp_Bits', 'Precipitation': 'Precip_Bits'}
+_coverage_cache = {}
+_coverage_lock = threading.Lock()
+
+def compute_coverage_rows(conn):
+    """Scan every state table and return one
+    (Station_ID, State, First_Year, Last_Year, MaxTemp_Bits, Precip_Bits) row per station.
+    Goes one state at a time so memory is bounded by the largest state, not the whole database."""
+    # Pass 1: the overall year range, from the distinct dates only
+    first_day, last_day = None, None
+    for state in STATES:
+        try:
+            dmy = pd.read_sql_query(f"SELECT DISTINCT DMY FROM {state} WHERE DMY IS NOT NULL", conn)['DMY']
+        except Exception as e:
+            print(f"Error scanning coverage for {state}: {e}")
+            continue
+        days = parse_dmy(dmy).astype('datetime64[D]')
+        days = days[~np.isnat(days)]
+        if len(days):
+            first_day = days.min() if first_day is None else min(first_day, days.min())
+            last_day = days.max() if last_day is None else max(last_day, days.max())
+    if first_day is None:
+        return []
+
+    first_year = int(first_day.astype('datetime64[Y]').astype(int)) + 1970
+    last_year = int(last_day.astype('datetime64[Y]').astype(int)) + 1970
+    origin = np.datetime64(f'{first_year}-01-01', 'D')
+    n_days = int((np.datetime64(f'{last_year + 1}-01-01', 'D') - origin).astype(int))
+
+    # Pass 2: the bitmaps, state by state
+    rows = []
+    for state in STATES:
+        try:
+            query = f"""
+            SELECT CAST(Location AS TEXT) as Station_ID, DMY as Date,
+            MaxTemp IS NOT NULL as Has_Temp, Precipitation IS NOT NULL as Has_Rain
+            FROM {state}
+            WHERE Location IS NOT NULL AND DMY IS NOT NULL
+            """
+            df = pd.read_sql_query(query, conn)
+        except Exception as e:
+            print(f"Error scanning coverage for {state}: {e}")
+            continue
+        days = parse_dmy(df['Date']).astype('datetime64[D]')
+        ok = ~np.isnat(days)
+        df, day_offset = df[ok], (days[ok] - origin).astype(np.int64)
+
+        station_codes, stations = pd.factorize(df['Station_ID'])
+        bitmaps = {}
+        for column, flag in (('MaxTemp', 'Has_Temp'), ('Precipitation', 'Has_Rain')):
+            present = np.zeros((len(stations), n_days), dtype=bool)
+            has_value = df[flag].values.astype(bool)
+            present[station_codes[has_value], day_offset[has_value]] = True
+            bitmaps[column] = np.packbits(present, axis=1)
+        for i, station_id in enumerate(stations):
+            rows.append((station_id, state, first_year, last_year,
+                         bitmaps['MaxTemp'][i].tobytes(), bitmaps['Precipitation'][i].tobytes()))
+    return rows
+
+def build_coverage_bitmaps():
+    """(Re)build the station_coverage table. Run after the climate data changes."""
+    conn = get_db_connection()
+    rows = compute_coverage_rows(conn)
+    conn.execute("DROP TABLE IF EXISTS station_coverage")
+    conn.execute("""
+    CREATE TABLE station_coverage (
+        Station_ID TEXT, State TEXT, First_Year INTEGER, Last_Year INTEGER,
+        MaxTemp_Bits BLOB, Precip_Bits BLOB
+    )""")
+    conn.executemany("INSERT INTO station_coverage VALUES (?, ?, ?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    _coverage_cache.clear()
+    return len(rows)
+
+def load_coverage():
+    """Bitmaps plus per-byte running popcounts, cached for the life of the process.
+    None when the station_coverage table hasn't been built."""
+    if 'stations' in _coverage_cache:
+        return _coverage_cache
+
+    with _coverage_lock:
+        # Another thread may have finished loading while this one waited
+        if 'stations' in _coverage_cache:
+            return _coverage_cache
+        conn = get_db_connection()
+        try:
+            rows = conn.execute("""
+            SELECT Station_ID, State, First_Year, Last_Year, MaxTemp_Bits, Precip_Bits FROM station_coverage
+            """).fetchall()
+        except sqlite3.Error:
+            rows = []
+        finally:
+            conn.close()
+        if not rows:
+            return None
+
+        first_year, last_year = rows[0][2], rows[0][3]
+        year_starts = np.array([f'{y}-01-01' for y in range(first_year, last_year + 2)], dtype='datetime64[D]')
+        station_ids = np.array([r[0] for r in rows], dtype=object)
+        states = np.array([r[1] for r in rows], dtype=object)
+        cache = {
+            'stations': pd.DataFrame({'Station_ID': station_ids, 'State': states}),
+            'station_ids': station_ids,
+            'states': states,
+            # "STATE:ID" -> row position, so filters can look stations up without building MultiIndexes
+            'positions': pd.Index(states + ':' + station_ids),
+            'first_year': first_year,
+            'last_year': last_year,
+            # bit offset of 1 Jan for every year, plus one past the end
+            'year_bits': (year_starts - year_starts[0]).astype(np.int64),
+        }
+        for position, column in enumerate(COVERAGE_METRICS, start=4):
+            # Extra zero byte so a prefix ending exactly on the last day is still in range
+            packed = np.array([np.frombuffer(r[position], dtype=np.uint8) for r in rows])
+            packed = np.hstack([packed, np.zeros((len(rows), 1), dtype=np.uint8)])
+            running = np.zeros((len(rows), packed.shape[1] + 1), dtype=np.int32)
+            running[:, 1:] = np.cumsum(np.bitwise_count(packed), axis=1)
+            cache[column] = (packed, running)
+        _coverage_cache.update(cache)
+    return _coverage_cache
+
+def coverage_available():
+    return load_coverage() is not None
+
+def _days_with_data(packed, running, bit_positions):
+    """For every station, how many of the first N days have a reading, for each N in
+    bit_positions. Whole bytes come from the running popcount, the partial byte from one
+    masked popcount - no unpacking."""
+    byte_index = bit_positions // 8
+    leftover = (bit_positions % 8).astype(np.uint8)
+    high_bits = (np.uint16(0xFF00) >> leftover).astype(np.uint8)  # bitorder='big': first day is the top bit
+    return running[:, byte_index] + np.bitwise_count(packed[:, byte_index] & high_bits)
+
+def _coverage_fractions(cov, metric, start_year=None, end_year=None):
+    """Coverage of [start_year, end_year] for every cached station, as an array in cache order."""
+    start_year = max(cov['first_year'], start_year or cov['first_year'])
+    end_year = min(cov['last_year'], end_year or cov['last_year'])
+    if start_year > end_year:
+        return np.zeros(len(cov['station_ids']))
+    bounds = cov['year_bits'][[start_year - cov['first_year'], end_year - cov['first_year'] + 1]]
+    counts = _days_with_data(*cov[metric], bounds)
+    return (counts[:, 1] - counts[:, 0]) / (bounds[1] - bounds[0])
+
+def _row_positions(cov, df):
+    """Cache row for each (Station_ID, State) row of df, -1 where the station isn't known."""
+    keys = [f"{state}:{station_id}" for state, station_id in zip(df['State'].values, df['Station_ID'].values)]
+    return cov['positions'].get_indexer(keys)
+
+def get_coverage(metric='MaxTemp', start_year=None, end_year=None):
+    """Fraction of days in [start_year, end_year] with a reading, per station."""
+    cov = load_coverage()
+    if cov is None or metric not in COVERAGE_METRICS:
+        return pd.DataFrame(columns=['Station_ID', 'State', 'Coverage'])
+    df = cov['stations'].copy()
+    df['Coverage'] = _coverage_fractions(cov, metric, start_year, end_year)
+    return df
+
+def lookup_coverage(df, metric='MaxTemp', start_year=None, end_year=None):
+    """Coverage for each (Station_ID, State) row of df, NaN where unknown or unavailable."""
+    cov = load_coverage()
+    if cov is None or df.empty:
+        return np.full(len(df), np.nan)
+    rows = _row_positions(cov, df)
+    fractions = _coverage_fractions(cov, metric, start_year, end_year)
+    return np.where(rows >= 0, fractions[rows], np.nan)
+
+def get_yearly_coverage(metric='MaxTemp'):
+    """Per-station completeness for every calendar year: (stations DataFrame, years, fractions)."""
+    cov = load_coverage()
+    if cov is None or metric not in COVERAGE_METRICS:
+        return pd.DataFrame(columns=['Station_ID', 'State']), [], np.empty((0, 0))
+    counts = np.diff(_days_with_data(*cov[metric], cov['year_bits']), axis=1)
+    fractions = counts / np.diff(cov['year_bits'])
+    return cov['stations'], list(range(cov['first_year'], cov['last_year'] + 1)), fractions
+
+def read_coverage_filter(form_data):
+    """The optional min_coverage / cov_start / cov_end / cov_metric query parameters
+    shared by every page. Returns None when no filter was asked for."""
+    def as_int(key):
+        try:
+            return int(str(form_data.get(key, '')).strip())
+        except ValueError:
+            return None
+    min_coverage = as_int('min_coverage')
+    if not min_coverage:
+        return None
+    metric = form_data.get('cov_metric', 'MaxTemp')
+    return {
+        'min_coverage': min_coverage,
+        'start': as_int('cov_start'),
+        'end': as_int('cov_end'),
+        'metric': metric if metric in COVERAGE_METRICS else 'MaxTemp',
+    }
+
+def _passing_mask(cov, coverage_filter):
+    fractions = _coverage_fractions(cov, coverage_filter['metric'], coverage_filter['start'], coverage_filter['end'])
+    return fractions >= coverage_filter['min_coverage'] / 100
+
+def apply_coverage_filter(df, coverage_filter):
+    """Keep only the rows of df (needs Station_ID and State) that meet the coverage filter.
+    df is returned unfiltered when coverage hasn't been built - coverage_filter_fields says so."""
+    if coverage_filter is None or df.empty:
+        return df
+    cov = load_coverage()
+    if cov is None:
+        return df
+    rows = _row_positions(cov, df)
+    keep = (rows >= 0) & _passing_mask(cov, coverage_filter)[rows]
+    return df[keep]
+
+def coverage_filtered_ids(state, station_ids, coverage_filter):
+    """Narrow a state's station list (all stations when station_ids is empty) by the coverage filter."""
+    cov = load_coverage() if coverage_filter is not None else None
+    if cov is None:
+        return station_ids or None
+    passing = cov['station_ids'][_passing_mask(cov, coverage_filter) & (cov['states'] == state)].tolist()
+    if station_ids:
+        passing_set = set(passing)
+        passing = [sid for sid in station_ids if sid in passing_set]
+    # An empty list would mean "no restriction" downstream, so keep an impossible ID instead
+    return passing or ['']
+
+def coverage_filter_fields(coverage_filter):
+    """Form inputs for the coverage filter, pre-filled with whatever is active."""
+    if not coverage_available():
+        note = ("Coverage filter not applied - run build_coverage.py to enable it." if coverage_filter
+                else "Coverage filter unavailable - run build_coverage.py to enable it.")
+        return f"""
+    <div style="color: #9a3412; font-size: 0.9rem;">{note}</div>"""
+    f = coverage_filter or {}
+    return f"""
+    <div style="display: flex; align-items: center; gap: 0.5rem; flex-wrap: wrap; color: #4b5563; font-size: 0.9rem;">
+        Only stations with ≥
+        <input type="text" name="min_coverage" value="{f.get('min_coverage') or ''}" placeholder="90" style="width: 4.5rem; padding: 0.5rem;">
+        % coverage from
+        <input type="text" name="cov_start" value="{f.get('start') or ''}" placeholder="1980" style="width: 5.5rem; padding: 0.5rem;">
+        to
+        <input type="text" name="cov_end" value="{f.get('end') or ''}" placeholder="2010" style="width: 5.5rem; padding: 0.5rem;">
+    </div>"""
+
+
+def coverage_json():
+    """Body of the /coverage route: station completeness as JSON."""
+    metric = request.args.get('cov_metric', 'MaxTemp')
+    if metric not in COVERAGE_METRICS:
+        return jsonify({'error': f"Unknown metric '{metric}'"}), 400
+
+    if not coverage_available():
+        return jsonify({'error': "Coverage hasn't been built - run build_coverage.py."}), 503
+
+    def as_int(key):
+        value = request.args.get(key, '').strip()
+        return int(value) if value.isdigit() else None
+    start, end = as_int('cov_start'), as_int('cov_end')
+
+    df = get_coverage(metric, start, end)
+    coverage_filter = read_coverage_filter(request.args)
+    if coverage_filter:
+        df = apply_coverage_filter(df, coverage_filter)
+    station_id, state = request.args.get('station'), request.args.get('state')
+    if station_id:
+        df = df[df['Station_ID'] == station_id]
+    if state:
+        df = df[df['State'] == state.upper()]
+
+    stations = [{'id': row.Station_ID, 'state': row.State, 'coverage': round(float(row.Coverage), 4)} for row in df.itertuples()]
+    # Year-by-year breakdown is only worth sending for a single station
+    if station_id and stations:
+        all_stations, years, fractions = get_yearly_coverage(metric)
+        for entry in stations:
+            i = all_stations.index[(all_stations['Station_ID'] == entry['id']) & (all_stations['State'] == entry['state'])][0]
+            entry['years'] = dict(zip(years, np.round(fractions[i], 4).tolist()))
+    return jsonify({'metric': metric, 'start': start, 'end': end, 'stations': stations})
@@ -0,0 +1,157 @@
+"""pandas-based data loaders for the analytics pages."""
+import pandas as pd
+import numpy as np
+
+from climate.db import STATES, PeriodError, get_db_connection, has_date_key, date_range_sql
+
+
+# --- 2. DATA LOADING FUNCTIONS ---
+def parse_dmy(date_column):
+    """Turn a column of DMY strings into datetime64 values (NaT where unparseable).
+    Each distinct string is parsed once and broadcast back to the rows."""
+    date_codes, date_strings = pd.factorize(date_column)
+    parsed = pd.to_datetime(pd.Series(date_strings), dayfirst=True, format='mixed', errors='coerce').values
+    return np.where(date_codes >= 0, parsed[date_codes], np.datetime64('NaT'))
+
+def get_station_names():
+    try:
+        conn = get_db_connection()
+        query = "SELECT site_id, name FROM weather_station" 
+        df = pd.read_sql_query(query, conn)
+        conn.close()
+        df['site_id'] = df['site_id'].astype(str)
+        return pd.Series(df['name'].values, index=df['site_id'].values).to_dict()
+    except Exception:
+        return {}
+
+def get_station_summary(start=None, end=None):
+    all_data = []
+    states = ['VIC', 'NSW', 'QLD', 'WA', 'SA', 'TAS', 'NT']
+    conn = get_db_connection()
+    try:
+        periods = {state: date_range_sql(conn, state, start, end) for state in states}
+    except PeriodError:
+        conn.close()
+        raise
+    
+    for state in states:
+        period_sql, period_params = periods[state]
+        try:
+            # FIX: We explicitly cast Location to TEXT inside the SQL query
+            query = f"""
+            SELECT CAST(Location AS TEXT) as Station_ID, '{state}' as State,
+            AVG(MaxTemp) as Avg_Temp, 
+            MAX(MaxTemp) as Highest_Temp,
+            SUM(Precipitation) as Total_Rainfall,
+            SUM(CASE WHEN Precipitation > 0 THEN 1 ELSE 0 END) as Rain_Days
+            FROM {state} 
+            WHERE MaxTemp IS NOT NULL AND Location IS NOT NULL{period_sql}
+            GROUP BY Location
+            """
+            df_state = pd.read_sql_query(query, conn, params=period_params)
+            if not df_state.empty:
+                all_data.append(df_state)
+        except Exception as e:
+            # This will show you exactly which table is failing in your terminal
+            print(f"Error loading table {state}: {e}")
+            continue 
+    conn.close()
+    
+    if all_data:
+        final_df = pd.concat(all_data, ignore_index=True)
+        # Ensure numeric columns are strictly numeric for matching
+        final_df['Avg_Temp'] = pd.to_numeric(final_df['Avg_Temp']).round(1)
+        final_df['Status'] = 'Active'
+        
+        # Link the readable names from your weather_station table
+        name_map = get_station_names()
+        final_df['Location_Name'] = final_df['Station_ID'].map(name_map).fillna(final_df['Station_ID'])
+        final_df['Location_Name'] = final_df['Location_Name'].str.title().str.strip()
+        return final_df
+    return pd.DataFrame()
+
+def get_station_history(station_id, state, start=None, end=None):
+    conn = get_db_connection()
+    try:
+        period_sql, period_params = date_range_sql(conn, state, start, end)
+    except PeriodError:
+        conn.close()
+        raise
+    try:
+        # Sort on the integer key when it exists - DMY strings don't sort chronologically
+        order_by = 'Date_Key' if has_date_key(conn, state) else 'Date'
+        query = f"""
+        SELECT DMY as Date, MaxTemp FROM {state} 
+        WHERE Location = '{station_id}' AND MaxTemp IS NOT NULL{period_sql}
+        ORDER BY {order_by} DESC LIMIT 50
+        """
+        df = pd.read_sql_query(query, conn, params=period_params)
+        conn.close()
+        df = df.iloc[::-1].reset_index(drop=True) if order_by == 'Date_Key' else df.sort_values('Date')
+        return df
+    except Exception:
+        return pd.DataFrame()
+
+
+# --- DATE KEY MIGRATION ---
+def dmy_key_sql(column):
+    """SQL expression turning a D/M/YYYY string (days and months padded or not) into
+    YYYYMMDD, or NULL for anything else. Used by the triggers that keep Date_Key current."""
+    rest = f"substr({column}, instr({column}, '/') + 1)"
+    return f"""(CASE WHEN {column} GLOB '[0-9]*/[0-9]*/[0-9][0-9][0-9][0-9]' THEN
+        CAST(substr({rest}, instr({rest}, '/') + 1) AS INTEGER) * 10000
+        + CAST(substr({rest}, 1, instr({rest}, '/') - 1) AS INTEGER) * 100
+        + CAST(substr({column}, 1, instr({column}, '/') - 1) AS INTEGER) END)"""
+
+def install_date_key_triggers(conn, state):
+    """Fill Date_Key on every future INSERT (and DMY UPDATE) so new loads don't need the
+    migration re-run. Only installed when the SQL parse agrees with parse_dmy on every
+    DMY already in the table - returns False (and drops any old triggers) otherwise."""
+    mismatches = conn.execute(f"""
+        SELECT COUNT(*) FROM (SELECT DISTINCT DMY FROM {state} WHERE DMY IS NOT NULL) d
+        LEFT JOIN dmy_lookup l ON l.DMY = d.DMY
+        WHERE {dmy_key_sql('d.DMY')} IS NOT l.Date_Key""").fetchone()[0]
+    for event in ('insert', 'update'):
+        conn.execute(f"DROP TRIGGER IF EXISTS trg_{state}_date_key_{event}")
+    if mismatches:
+        return False
+    for event, when in (('insert', 'INSERT'), ('update', 'UPDATE OF DMY')):
+        conn.execute(f"""
+            CREATE TRIGGER trg_{state}_date_key_{event} AFTER {when} ON {state}
+            BEGIN
+                UPDATE {state} SET Date_Key = {dmy_key_sql('NEW.DMY')} WHERE rowid = NEW.rowid;
+            END""")
+    return True
+
+def migrate_date_keys():
+    """Add and fill Date_Key on every state table, index it and install the triggers
+    that keep it current. Safe to re-run."""
+    conn = get_db_connection()
+    migrated = []
+    for state in STATES:
+        try:
+            if not has_date_key(conn, state):
+                conn.execute(f"ALTER TABLE {state} ADD COLUMN Date_Key INTEGER")
+
+            # Parse each distinct DMY once, then fill the column in a single UPDATE via a lookup table
+            dmy = pd.read_sql_query(f"SELECT DISTINCT DMY FROM {state} WHERE DMY IS NOT NULL", conn)['DMY']
+            days = pd.DatetimeIndex(parse_dmy(dmy))
+            keys = days.year * 10000 + days.month * 100 + days.day
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS dmy_lookup (DMY TEXT PRIMARY KEY, Date_Key INTEGER)")
+            conn.execute("DELETE FROM dmy_lookup")
+            conn.executemany("INSERT INTO dmy_lookup VALUES (?, ?)",
+                             [(d, int(k)) for d, k in zip(dmy, keys) if not pd.isna(k)])
+            conn.execute(f"UPDATE {state} SET Date_Key = (SELECT Date_Key FROM dmy_lookup WHERE dmy_lookup.DMY = {state}.DMY)")
+
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{state}_location_date ON {state} (Location, Date_Key)")
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{state}_date ON {state} (Date_Key)")
+            if not install_date_key_triggers(conn, state):
+                print(f"{state} has DMY values that aren't D/M/YYYY - no trigger installed, "
+                      f"re-run migrate_dates.py after every load into {state}.")
+            conn.commit()
+            migrated.append(state)
+        except Exception as e:
+            conn.rollback()
+            print(f"Error migrating table {state}: {e}")
+    conn.close()
+    return migrated
@@ -0,0 +1,94 @@
+"""Database access and the typed-date helpers shared by every module.
+
+Deliberately free of pandas/NumPy so the routing core can import it cheaply."""
+import calendar
+import os
+import sqlite3
+from datetime import datetime
+from html import escape
+
+
+# --- 1. DATABASE CONNECTION ---
+STATES = ['VIC', 'NSW', 'QLD', 'WA', 'SA', 'TAS', 'NT']
+
+def get_db_connection():
+    # This automatically finds the project folder (the one app.py sits in, above this package)
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # This joins that folder path with your database filename
+    # (CLIMATE_DB lets the load tester point the app at a synthetic copy)
+    db_file = os.environ.get('CLIMATE_DB') or os.path.join(base_dir, 'Climate_Data.db')
+    return sqlite3.connect(db_file)
+
+# --- 1b. TYPED DATES ---
+# DMY is free text, so every state table also gets an indexed integer Date_Key
+# (YYYYMMDD) from migrate_dates.py. Periods are then plain integer range
+# predicates that SQLite can answer from the index.
+_date_key_tables = set()
+
+def has_date_key(conn, state):
+    if state not in _date_key_tables:
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_info({state})")]
+        if 'Date_Key' not in columns:
+            return False
+        _date_key_tables.add(state)
+    return True
+
+class PeriodError(ValueError):
+    """A start/end period that can't be honoured. Pages show the message, routes return 400."""
+
+# (format, what a bare value covers) - a year or month means its first day for a start
+# and its last day for an end
+PERIOD_FORMATS = [('%Y', 'year'), ('%Y-%m', 'month'), ('%Y-%m-%d', 'day'), ('%d/%m/%Y', 'day')]
+
+def parse_date_key(value, end_of_period=False):
+    """'1980', '1980-06', '1980-6-15' or '15/06/1980' -> 19800615 (None if blank).
+    Raises PeriodError for anything else, including impossible months and days."""
+    text = str(value or '').strip()
+    if not text:
+        return None
+    for fmt, unit in PERIOD_FORMATS:
+        try:
+            day = datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+        if end_of_period and unit == 'year':
+            day = day.replace(month=12, day=31)
+        elif end_of_period and unit == 'month':
+            day = day.replace(day=calendar.monthrange(day.year, day.month)[1])
+        return day.year * 10000 + day.month * 100 + day.day
+    raise PeriodError(f"'{text}' isn't a date - use YYYY, YYYY-MM, YYYY-MM-DD or DD/MM/YYYY.")
+
+def read_period(form_data):
+    start = parse_date_key(form_data.get('start'))
+    end = parse_date_key(form_data.get('end'), end_of_period=True)
+    if start is not None and end is not None and start > end:
+        raise PeriodError("The period's start date is after its end date.")
+    return start, end
+
+def period_fields(form_data):
+    """From/To inputs for the start and end parameters, pre-filled with what was asked for."""
+    start, end = escape(form_data.get('start', '')), escape(form_data.get('end', ''))
+    return f"""
+    <div style="display: flex; align-items: center; gap: 0.5rem; flex-wrap: wrap; color: #4b5563; font-size: 0.9rem;">
+        Period from
+        <input type="text" name="start" value="{start}" placeholder="1970" style="width: 7.5rem; padding: 0.5rem;">
+        to
+        <input type="text" name="end" value="{end}" placeholder="2020-12-31" style="width: 7.5rem; padding: 0.5rem;">
+    </div>"""
+
+def date_range_sql(conn, state, start=None, end=None, alias=''):
+    """SQL fragment (starting with AND) and params restricting a state table to [start, end].
+    Raises PeriodError if a bound is given but the table hasn't been migrated."""
+    if start is None and end is None:
+        return "", []
+    if not has_date_key(conn, state):
+        # Never quietly widen the period - the caller would return data that wasn't asked for
+        raise PeriodError(f"Date filtering isn't available yet: {state} has no Date_Key column - run python migrate_dates.py.")
+    clause, params = "", []
+    if start is not None:
+        clause += f" AND {alias}Date_Key >= ?"
+        params.append(start)
+    if end is not None:
+        clause += f" AND {alias}Date_Key <= ?"
+        params.append(end)
+    return clause, params
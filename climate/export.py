@@ -0,0 +1,75 @@
+"""CSV export for the /download route."""
+from flask import request, send_file
+import pandas as pd
+import io
+
+from climate.db import PeriodError, get_db_connection, date_range_sql, read_period
+
+
+def download_csv():
+    """Body of the /download route: the configured CSV report."""
+    include_temp = request.args.get('temp') == 'on'
+    include_rain = request.args.get('rain') == 'on'
+    states = ['VIC', 'NSW', 'QLD', 'WA', 'SA', 'TAS', 'NT']
+    all_data = []
+    conn = get_db_connection()
+    try:
+        start, end = read_period(request.args)
+        periods = {state: date_range_sql(conn, state, start, end, alias='t.') for state in states}
+    except PeriodError as e:
+        conn.close()
+        return str(e), 400
+    
+    # 1. Determine dynamic file name
+    if include_temp and include_rain:
+        file_label = "Full_Climate_Report"
+    elif include_temp:
+        file_label = "Temperature_Report"
+    else:
+        file_label = "Precipitation_Report"
+
+    for state in states:
+        try:
+            # 2. Updated Query to JOIN and get Location Name
+            cols = ["t.Location", "s.name as Location_Name", "t.DMY as Date"]
+            if include_temp: cols.append("t.MaxTemp")
+            if include_rain: cols.append("t.Precipitation")
+            period_sql, period_params = periods[state]
+            
+            query = f"""
+                SELECT {', '.join(cols)}, '{state}' as State
+                FROM {state} t
+                LEFT JOIN weather_station s ON CAST(t.Location AS TEXT) = CAST(s.site_id AS TEXT)
+                WHERE 1 = 1{period_sql}
+                LIMIT 1000
+            """
+            df_export = pd.read_sql_query(query, conn, params=period_params)
+            all_data.append(df_export)
+        except Exception:
+            continue
+    conn.close()
+
+    if not all_data:
+        return "No data available for export.", 404
+
+    final_df = pd.concat(all_data, ignore_index=True)
+    
+    # Clean up Location_Name formatting
+    if 'Location_Name' in final_df.columns:
+        final_df['Location_Name'] = final_df['Location_Name'].str.title()
+    
+    proxy = io.StringIO()
+    final_df.to_csv(proxy, index=False)
+    
+    mem = io.BytesIO()
+    mem.write(proxy.getvalue().encode('utf-8'))
+    mem.seek(0)
+    proxy.close()
+
+    # 3. Use the unique file_label here
+    return send_file(
+        mem,
+        mimetype='text/csv',
+        as_attachment=True,
+        download_name=f'australian_{file_label}.csv'
+    )
@@ -0,0 +1,339 @@
+"""Page routing and the shared HTML layout. No pandas/NumPy here - see views.py."""
+from html import escape
+
+from climate.db import PeriodError, period_fields
+
+# Pages whose content comes from the database; everything else is static HTML
+DYNAMIC_PAGES = ('data', 'temps', 'metrics', 'similarity', 'compare')
+
+
+# --- 3. HTML GENERATOR ---
+def get_page_html(form_data):
+    raw_page = form_data.get('page')
+    current_page = raw_page[0] if isinstance(raw_page, list) else raw_page
+    if current_page:
+        current_page = str(current_page).strip().lower()
+    else:
+        current_page = 'home'
+
+    # --- DEFINE CONTENT ---
+    if current_page == 'home':
+        content = """
+        <section class="hero">
+            <h1>Australian Climate Analytics</h1>
+            <p>A modern decision support system for analyzing historical weather trends (1970–2020). Now covering all states and territories.</p>
+        </section>
+        <div class="main-container grid-container">
+            <div class="card"><div class="card-header"><i data-lucide="search" class="card-icon"></i><h3>Station Explorer</h3></div><p>Access raw historical data by region.</p><a href="?page=data" class="btn-black">Explore Data</a></div>
+            <div class="card"><div class="card-header"><i data-lucide="trending-up" class="card-icon"></i><h3>Temp Trends</h3></div><p>Compare temperature shifts over decades.</p><a href="?page=temps" class="btn-black">View Trends</a></div>
+            <div class="card"><div class="card-header"><i data-lucide="cloud-rain" class="card-icon"></i><h3>Metric Viewer</h3></div><p>Deep dive into specific weather metrics.</p><a href="?page=metrics" class="btn-black">Analyze</a></div>
+            <div class="card"><div class="card-header"><i data-lucide="link" class="card-icon"></i><h3>Similarity Check</h3></div><p>Find stations with matching patterns.</p><a href="?page=similarity" class="btn-black">Run Check</a></div>
+            <div class="card"><div class="card-header"><i data-lucide="grid-3x3" class="card-icon"></i><h3>Station Compare</h3></div><p>See which stations' temperatures move together.</p><a href="?page=compare" class="btn-black">Compare</a></div>
+            <div class="card"><div class="card-header"><i data-lucide="download" class="card-icon"></i><h3>Export Data</h3></div><p>Download generated reports.</p><a href="?page=export" class="btn-black">Download</a></div>
+            <div class="card"><div class="card-header"><i data-lucide="users" class="card-icon"></i><h3>Our Team</h3></div><p>Meet the analysts and developers.</p><a href="?page=about" class="btn-black">Meet Team</a></div>
+        </div>"""
+    
+    elif current_page in DYNAMIC_PAGES:
+        # pandas/NumPy are only imported the first time one of these is requested
+        from climate import views
+        try:
+            content = getattr(views, f'{current_page}_page')(form_data)
+        except PeriodError as e:
+            content = f"""
+        <section class="hero"><h1>Invalid Period</h1><p>{escape(str(e))}</p></section>
+        <div class="main-container" style="text-align: center;"><a href="?page={current_page}" class="btn-black">Back</a></div>"""
+    
+    elif current_page == 'export':
+            content = """
+            <section class="hero">
+                <h1>Export Data</h1>
+                <p>Generate and download historical climate datasets for offline analysis.</p>
+            </section>
+            <div class="main-container" style="max-width: 900px;">
+                <div class="glass-panel" style="display: grid; grid-template-columns: 1fr 1fr; gap: 3rem; padding: 4rem; align-items: center;">
+                    
+                    <div style="text-align: left; border-right: 1px solid rgba(0,0,0,0.05); padding-right: 3rem;">
+                        <h3 style="margin-bottom: 1.5rem; font-size: 1.4rem;">Dataset Summary</h3>
+                        <p style="color: #6b7280; line-height: 1.6; margin-bottom: 2rem;">Downloads include data from all 7 Australian states and territories, covering records from 1970 to 2020.</p>
+                        <div style="display: flex; flex-direction: column; gap: 1rem;">
+                            <div style="display: flex; align-items: center; gap: 12px; color: #4b5563; font-size: 0.9rem;">
+                                <i data-lucide="file-text" style="width: 18px; height: 18px; color: #ea580c;"></i> CSV Format (Excel Compatible)
+                            </div>
+                            <div style="display: flex; align-items: center; gap: 12px; color: #4b5563; font-size: 0.9rem;">
+                                <i data-lucide="map-pin" style="width: 18px; height: 18px; color: #ea580c;"></i> Includes Location Names
+                            </div>
+                        </div>
+                    </div>
+
+                    <div style="text-align: left; display: flex; flex-direction: column; justify-content: center;">
+                        <form action="/download" method="get">
+                            <div class="form-group" style="margin-bottom: 2.5rem;">
+                                <label style="margin-bottom: 1.25rem; display: block; font-weight: 600;">Configure Download</label>
+                                <div style="display: flex; flex-direction: column; gap: 1.25rem;">
+                                    <label style="display: flex; align-items: center; gap: 12px; cursor: pointer; font-size: 1rem;">
+                                        <input type="checkbox" name="temp" checked style="width: 20px; height: 20px; accent-color: #ea580c;"> 
+                                        <span>Temperature Records</span>
+                                    </label>
+                                    <label style="display: flex; align-items: center; gap: 12px; cursor: pointer; font-size: 1rem;">
+                                        <input type="checkbox" name="rain" style="width: 20px; height: 20px; accent-color: #ea580c;"> 
+                                        <span>Precipitation Data</span>
+                                    </label>
+                                    """ + period_fields(form_data) + """
+                                </div>
+                            </div>
+                            <button type="submit" class="btn-black" style="width: 100%; padding: 1.2rem; font-size: 1rem;">
+                                <i data-lucide="download" style="width: 18px; height: 18px; vertical-align: middle; margin-right: 8px;"></i>
+                                Download CSV
+                            </button>
+                        </form>
+                    </div>
+
+                </div>
+            </div>
+            """
+
+    elif current_page == 'about':
+            content = """
+            <section class="hero">
+                <h1>The Developer</h1>
+                <p>The mind behind the Australian Climate Analytics system.</p>
+            </section>
+            
+            <div class="main-container" style="max-width: 850px; margin-bottom: 0.5rem;">
+                <div class="glass-panel" style="text-align: center; padding: 4rem;">
+                    <h3 style="font-size: 2.5rem; margin-bottom: 0.5rem;">Tanisha Sinha</h3>
+                    <p style="color: #ea580c; font-weight: 600; font-size: 1.1rem; margin-bottom: 1.5rem;">Full-Stack Developer & Data Architect</p>
+                    <p style="color: #6b7280; line-height: 1.8; max-width: 650px; margin: 0 auto;">
+                        I designed and built this Decision Support System to bridge the gap between complex climate datasets 
+                        and actionable insights. By integrating Python-driven analytics with a modern, user-centric interface, 
+                        I aim to provide researchers and planners with a seamless tool for historical climate evaluation.
+                    </p>
+                </div>
+            </div>
+
+            <section class="hero" style="padding-top: 0.5rem;">
+                <h1 style="margin-bottom: 2rem;">Target Personas</h1>
+                <p>Who benefits from Australian Climate Analytics?</p>
+            </section>
+            
+            <div class="main-container grid-container" style="grid-template-columns: repeat(auto-fit, minmax(260px, 1fr)); gap: 2rem;">
+                <div class="glass-panel" style="padding: 2.5rem; text-align: left;">
+                    <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 1rem;">
+                        <i data-lucide="microscope" style="color: #ea580c; width: 24px; height: 24px;"></i>
+                        <h3 style="font-size: 1.1rem;">Environmental Researchers</h3>
+                    </div>
+                    <p style="font-size: 0.85rem; color: #6b7280; line-height: 1.6;">Analyzing long-term climate shifts to study impacts on local ecosystems and biodiversity patterns.</p>
+                </div>
+                
+                <div class="glass-panel" style="padding: 2.5rem; text-align: left;">
+                    <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 1rem;">
+                        <i data-lucide="sprout" style="color: #ea580c; width: 24px; height: 24px;"></i>
+                        <h3 style="font-size: 1.1rem;">Agricultural Planners</h3>
+                    </div>
+                    <p style="font-size: 0.85rem; color: #6b7280; line-height: 1.6;">Utilizing historical rainfall data to optimize crop cycles and land management strategies.</p>
+                </div>
+
+                <div class="glass-panel" style="padding: 2.5rem; text-align: left;">
+                    <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 1rem;">
+                        <i data-lucide="home" style="color: #ea580c; width: 24px; height: 24px;"></i>
+                        <h3 style="font-size: 1.1rem;">Urban Developers</h3>
+                    </div>
+                    <p style="font-size: 0.85rem; color: #6b7280; line-height: 1.6;">Leveraging extreme heat records to design climate-resilient housing and sustainable public infrastructure.</p>
+                </div>
+
+                <div class="glass-panel" style="padding: 2.5rem; text-align: left;">
+                    <div style="display: flex; align-items: center; gap: 12px; margin-bottom: 1rem;">
+                        <i data-lucide="graduation-cap" style="color: #ea580c; width: 24px; height: 24px;"></i>
+                        <h3 style="font-size: 1.1rem;">Educational Institutions</h3>
+                    </div>
+                    <p style="font-size: 0.85rem; color: #6b7280; line-height: 1.6;">Accessing raw datasets for data science projects and geographic historical studies in universities.</p>
+                </div>
+            </div>
+            """
+
+    else: 
+        content = """<section class="hero"><h1>Under Construction</h1></section>"""
+
+    # --- 4. BUILD THE TEMPLATE (Updated for darker boxes) ---
+    html = f"""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no">
+        <title>Australian Climate Analytics</title>
+        <link href="https://fonts.googleapis.com/css2?family=DM+Serif+Display&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+        <script src="https://unpkg.com/lucide@latest"></script>
+        <style>
+            * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+            body {{
+                font-family: 'Inter', sans-serif; color: #1f2937; background-color: #fcfcfc; background-attachment: fixed; background-size: cover;
+                background-image: radial-gradient(circle at 2% 2%, rgba(190, 140, 90, 0.4) 0%, transparent 40%), radial-gradient(circle at 90% 85%, rgba(190, 140, 90, 0.4) 0%, transparent 50%);
+                min-height: 100vh; padding-top: 2rem; display: flex; flex-direction: column;
+
+/* --- PRESERVED DESKTOP DESIGN --- */
+            nav {{
+                position: sticky; 
+                top: 2rem; 
+                z-index: 1000; 
+                display: flex; 
+                align-items: center; 
+                justify-content: space-between; 
+                width: fit-content; 
+                max-width: 95%; 
+                margin: 0 auto 2rem auto; 
+                padding: 0.75rem 2rem; 
+                gap: 2rem;
+                background: rgba(255, 255, 255, 0.6); 
+                backdrop-filter: blur(25px); 
+                border: 1px solid rgba(255, 255, 255, 0.8); 
+                border-radius: 99px;
+                box-shadow: 0 20px 40px -5px rgba(0, 0, 0, 0.15);
+            }}
+
+/* --- ZOOM-PROOF MOBILE NAVIGATION --- */
+            @media (max-width: 768px) {{
+                nav {{
+                    width: 95% !important; 
+                    padding: 0.5rem 0.8rem !important; 
+                    display: flex !important;
+                    justify-content: space-between !important; /* Forces logo left, links right */
+                    gap: 0 !important; /* Removes the rigid gap that causes overlap */
+                }}
+                .logo {{ 
+                    font-size: 0.85rem !important; 
+                    flex-shrink: 0; /* Prevents logo from being squashed */
+                    margin-right: 5px !important;
+                }}
+                .nav-links {{ 
+                    display: flex !important;
+                    gap: 3px !important; /* Tiny, stable gap for the 8 links */
+                    justify-content: flex-end;
+                    flex-wrap: nowrap; /* Keeps everything on one line */
+                }}
+                .nav-links a {{ 
+                    font-size: 0.6rem !important; 
+                    padding: 0.3rem 0.4rem !important; 
+                    white-space: nowrap; /* Prevents link text from breaking */
+                }}
+                .nav-btn {{
+                    padding: 0.3rem 0.6rem !important;
+                }}
+                .hero h1 {{
+                    font-size: 2.8rem !important;
+                }}
+            }}
+
+/* --- UPDATED HERO & CONTAINER --- */
+            .hero h1 {{ 
+                font-family: 'DM Serif Display', serif; 
+                font-size: 4.5rem; 
+                font-weight: 400; 
+                line-height: 1.1; 
+                margin-bottom: 1.7rem; 
+                color: #111; 
+                transition: font-size 0.3s ease;
+            }}
+
+            .main-container {{ 
+                flex-grow: 1; 
+                max-width: 1200px; 
+                margin: 0 auto; 
+                width: 100%; 
+                padding: 0 2rem 4rem 2rem; 
+            }}
+
+/* --- MOBILE-SPECIFIC ADJUSTMENTS --- */
+            @media (max-width: 768px) {{
+            
+
+                .hero h1 {{
+                    font-size: 2.8rem !important; /* Prevents title overflow on phone */
+                    margin-bottom: 1.2rem;
+                }}
+                .main-container {{ 
+                    padding: 0 1.25rem 3rem 1.25rem; /* Better side margins on small screens */
+                }}
+                .grid-container {{ 
+                    grid-template-columns: 1fr; /* Stacks cards vertically for better mobile reading */
+                    gap: 1.5rem; 
+                }}
+
+            /* Enhanced Mobile Checkbox Fix */
+                input[type="checkbox"] {{
+                    -webkit-appearance: checkbox; /* Ensures standard look on iOS */
+                    width: 26px !important;
+                    height: 26px !important;
+                    margin-right: 12px !important;
+                    cursor: pointer;
+                }}
+            }}
+
+            .logo {{ font-family: 'DM Serif Display', serif; font-size: 1.4rem; color: #111; letter-spacing: 0.5px; white-space: nowrap; }}
+            .logo span {{ color: #ea580c; }}
+            .nav-links {{ display: flex; gap: 1rem; list-style: none; align-items: center; margin: 0; }}
+            .nav-links a {{ text-decoration: none; color: #4b5563; font-weight: 500; font-size: 0.9rem; transition: all 0.2s ease; padding: 0.5rem 0.8rem; border-radius: 99px; }}
+            .nav-btn {{ background-color: #ea580c; color: white !important; box-shadow: 0 4px 10px rgba(234, 88, 12, 0.3); padding: 0.6rem 1.2rem !important; }}
+            .hero {{ text-align: center; padding: 3rem 1rem 3rem 1rem; max-width: 1200px; margin: 0 auto; }}
+
+            .hero p {{ color: #555; font-size: 1.125rem; line-height: 1.6; max-width: 600px; margin: 0 auto 1rem auto; }}
+
+
+/* --- UPDATED: DARKER PANELS & CARDS WITH HOVER --- */
+            .glass-panel, .card {{
+                background: rgba(255, 255, 255, 0.92); 
+                backdrop-filter: blur(10px); 
+                border: 1.5px solid rgba(255, 255, 255, 1); 
+                border-radius: 24px; 
+                box-shadow: 0 8px 32px rgba(0, 0, 0, 0.06);
+                /* This line makes the movement smooth */
+                transition: transform 0.3s ease-out, box-shadow 0.3s ease-out;
+            }}
+
+            /* This block makes the boxes lift up when you mouse over them */
+            .glass-panel:hover, .card:hover {{
+                transform: translateY(-8px);
+                box-shadow: 0 15px 45px rgba(0, 0, 0, 0.1);
+            }}
+            
+            .glass-panel {{ background: rgba(255, 255, 255, 0.92); backdrop-filter: blur(10px); border: 1.5px solid rgba(255, 255, 255, 1); border-radius: 24px; box-shadow: 0 8px 32px rgba(0, 0, 0, 0.06); }}
+            .grid-container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(340px, 1fr)); gap: 3rem; }}
+            /* --- UPDATED: DARKER CARDS --- */
+            .card {{ background: rgba(255, 255, 255, 0.92); border: 1.5px solid rgba(255, 255, 255, 1); border-radius: 20px; padding: 2rem; display: flex; flex-direction: column; align-items: flex-start; transition: transform 0.3s cubic-bezier(0.25, 0.8, 0.25, 1); box-shadow: 0 4px 20px rgba(0, 0, 0, 0.05); }}
+            .card:hover {{ transform: translateY(-5px); box-shadow: 0 15px 35px rgba(0, 0, 0, 0.1); }}
+            .card-header {{ display: flex; align-items: center; gap: 12px; margin-bottom: 1.25rem; width: 100%; }}
+            .card-icon {{ width: 24px; height: 24px; color: #111; }}
+            .card h3 {{ font-size: 1.25rem; font-weight: 600; color: #111; margin: 0; }}
+            .card p {{ font-size: 0.95rem; color: #6b7280; line-height: 1.5; margin-bottom: 2rem; flex-grow: 1; }}
+            .btn-black {{ display: inline-block; background-color: #111; color: white; padding: 0.75rem 1.5rem; border-radius: 8px; text-decoration: none; cursor: pointer; transition: all 0.2s ease; font-weight: 500; border: none; width: fit-content; }}
+            .btn-black:hover {{ background-color: #000; transform: translateY(-3px); box-shadow: 0 6px 15px rgba(0,0,0,0.15); }}
+            .form-group {{ margin-bottom: 1.5rem; text-align: left; }}
+            label {{ display: block; font-weight: 600; margin-bottom: 0.5rem; color: #374151; }}
+            input[type="text"], select {{ width: 100%; padding: 0.8rem; border-radius: 8px; border: 1px solid #d1d5db; background: rgba(255,255,255,1); }}
+            table {{ width: 100%; border-collapse: collapse; text-align: left; }}
+            th, td {{ padding: 1.2rem; border-top: 1px solid rgba(0,0,0,0.05); color: #4b5563; }}
+            .badge-green {{ background: #dcfce7; color: #166534; padding: 0.25rem 0.75rem; border-radius: 99px; font-size: 0.75rem; font-weight: 600; }}
+            footer {{ text-align: center; padding: 2rem; color: #9ca3af; font-size: 0.9rem; margin-top: 2rem; }}
+        </style>
+    </head>
+    <body>
+        <nav>
+            <div class="logo">CLIMATE<span>.AU</span></div>
+            <ul class="nav-links">
+                <li><a href="?page=home" class="{'nav-btn' if current_page == 'home' else ''}">Home</a></li>
+                <li><a href="?page=data" class="{'nav-btn' if current_page == 'data' else ''}">Data</a></li>
+                <li><a href="?page=temps" class="{'nav-btn' if current_page == 'temps' else ''}">Temps</a></li>
+                <li><a href="?page=metrics" class="{'nav-btn' if current_page == 'metrics' else ''}">Metrics</a></li>
+                <li><a href="?page=similarity" class="{'nav-btn' if current_page == 'similarity' else ''}">Similarity</a></li>
+                <li><a href="?page=compare" class="{'nav-btn' if current_page == 'compare' else ''}">Compare</a></li>
+                <li><a href="?page=export" class="{'nav-btn' if current_page == 'export' else ''}">Export</a></li>
+                <li><a href="?page=about" class="{'nav-btn' if current_page == 'about' else ''}">About</a></li>
+            </ul>
+        </nav>
+        {content}
+        <footer><p>© 2025 Australian Climate Analytics. All rights reserved.</p></footer>
+        <script>lucide.createIcons();</script>
+    </body>
+    </html>
+    """
+    return html
@@ -0,0 +1,425 @@
+"""Content for the data-driven pages. Imported on first use so static pages never load pandas."""
+import pandas as pd
+import numpy as np
+import json
+from html import escape
+from urllib.parse import urlencode
+
+from climate.db import STATES, PeriodError, get_db_connection, read_period, period_fields, date_range_sql
+from climate.data import get_station_names, get_station_summary, get_station_history
+from climate.compare import get_station_comparison, has_comparable_pairs
+from climate.coverage import (lookup_coverage, read_coverage_filter, apply_coverage_filter,
+                              coverage_filtered_ids, coverage_filter_fields)
+
+
+def data_page(form_data):
+    coverage_filter = read_coverage_filter(form_data)
+    start, end = read_period(form_data)
+    df = apply_coverage_filter(get_station_summary(start, end), coverage_filter)
+    period_query = urlencode({k: form_data.get(k) for k in ('start', 'end') if form_data.get(k)})
+    if not df.empty:
+        # Show the coverage the filter judged, else the coverage over the years of the period
+        if coverage_filter:
+            coverage_args = (coverage_filter['metric'], coverage_filter['start'], coverage_filter['end'])
+        else:
+            coverage_args = ('MaxTemp', start and start // 10000, end and end // 10000)
+        df = df.assign(Coverage=lookup_coverage(df, *coverage_args))
+    table_rows = ""
+    if not df.empty:
+        for index, row in df.iterrows():
+            table_rows += f"""
+            <tr>
+                <td><strong>{row['Location_Name']}</strong> <span style="color:#9ca3af; font-size:0.8em;">({row['Station_ID']})</span></td>
+                <td>{row['State']}</td>
+                <td>{row['Avg_Temp']}°C</td>
+                <td>{'–' if pd.isna(row['Total_Rainfall']) else f"{int(row['Total_Rainfall'])}mm"}</td>
+                <td>{'–' if pd.isna(row['Coverage']) else f"{row['Coverage']:.0%}"}</td>
+                <td><span class="badge badge-green">{row['Status']}</span></td>
+                <td><a href="?page=temps&station={row['Station_ID']}&state={row['State']}{'&' + period_query if period_query else ''}" style="color:#ea580c; text-decoration:none;">View →</a></td>
+            </tr>"""
+    else:
+        table_rows = "<tr><td colspan='7'>No data found.</td></tr>"
+        
+    content = f"""
+    <section class="hero"><h1>Station Explorer</h1><p>Real-time data from all Australian States.</p></section>
+    <div class="main-container">
+        <div class="glass-panel" style="padding: 1.25rem 2rem; margin-bottom: 2rem;">
+            <form action="/" method="get" style="display: flex; align-items: center; justify-content: space-between; gap: 1rem; flex-wrap: wrap;">
+                <input type="hidden" name="page" value="data">
+                {period_fields(form_data)}
+                {coverage_filter_fields(coverage_filter)}
+                <button type="submit" class="btn-black">Filter</button>
+            </form>
+        </div>
+        <div class="glass-panel" style="padding: 0; overflow: hidden;">
+            <table><thead><tr><th>Station Name</th><th>State</th><th>Avg Max Temp</th><th>Total Rain</th><th>Coverage</th><th>Status</th><th>Action</th></tr></thead><tbody>{table_rows}</tbody></table>
+        </div>
+    </div>"""
+    return content
+
+
+def temps_page(form_data):
+    selected_station = form_data.get('station')
+    selected_state = form_data.get('state')
+    chart_script = ""
+    chart_title = "Select a station to view history"
+    
+    if selected_station and selected_state:
+        history_df = get_station_history(selected_station, selected_state, *read_period(form_data))
+        name_map = get_station_names()
+        station_name = escape(name_map.get(str(selected_station), selected_station).title())
+        
+        if not history_df.empty:
+            chart_title = f"Temperature History: {station_name}"
+            dates = history_df['Date'].tolist()
+            temps = history_df['MaxTemp'].tolist()
+            chart_script = f"""
+            <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+            <script>
+                const ctx = document.getElementById('trendChart').getContext('2d');
+                const gradient = ctx.createLinearGradient(0, 0, 0, 400);
+                gradient.addColorStop(0, 'rgba(234, 88, 12, 0.4)');
+                gradient.addColorStop(1, 'rgba(234, 88, 12, 0.0)');
+
+                new Chart(ctx, {{
+                    type: 'line',
+                    data: {{
+                        labels: {dates}, 
+                        datasets: [{{
+                            label: 'Max Temp (°C)', data: {temps},
+                            borderColor: '#ea580c', backgroundColor: gradient,
+                            pointBackgroundColor: '#fff', pointBorderColor: '#ea580c',
+                            pointRadius: 4, pointHoverRadius: 6, borderWidth: 2, tension: 0.4, fill: true
+                        }}]
+                    }},
+                    options: {{
+                        responsive: true, maintainAspectRatio: false,
+                        plugins: {{ legend: {{ display: false }} }},
+                        scales: {{ 
+                            x: {{ 
+                                grid: {{ display: false }}, 
+                                ticks: {{ 
+                                    font: {{ family: "'Inter', sans-serif" }},
+                                    maxRotation: 0, minRotation: 0, autoSkip: true, maxTicksLimit: 12
+                                }} 
+                            }},
+                            y: {{ grid: {{ color: 'rgba(0,0,0,0.05)', borderDash: [5, 5] }}, ticks: {{ font: {{ family: "'Inter', sans-serif" }} }} }} 
+                        }}
+                    }}
+                }});
+            </script>"""
+        else:
+            chart_title = f"No Data Found for {station_name}"
+
+    compare_state = escape(str(selected_state or '').strip().upper())
+    compare_link = f'<a href="?page=compare&state={compare_state}" style="color:#ea580c; text-decoration:none;">Compare all {compare_state} stations →</a>' if compare_state in STATES else ''
+    chart_area = '<canvas id="trendChart"></canvas>' if selected_station else """<div style="text-align: center; color: #9ca3af;"><i data-lucide="bar-chart-2" style="width: 64px; height: 64px; margin-bottom: 1rem;"></i><p>Please select a station from the <a href="?page=data" style="color:#ea580c;">Data Page</a></p></div>"""
+    content = f"""
+    <section class="hero"><h1>Temperature Trends</h1><p>{chart_title}</p>{compare_link}</section>
+    <div class="main-container"><div class="glass-panel" style="text-align: center; min-height: 400px; display: flex; align-items: center; justify-content: center; flex-direction: column; padding: 2rem;">{chart_area}</div></div>
+    {chart_script}"""
+    return content
+
+
+def metrics_page(form_data):
+    selected_metric = form_data.get('metric', 'rain')
+    coverage_filter = read_coverage_filter(form_data)
+    df = apply_coverage_filter(get_station_summary(*read_period(form_data)), coverage_filter)
+    
+    if not df.empty:
+        if selected_metric == 'temp':
+            df = df.sort_values('Avg_Temp', ascending=True)
+            chart_label, page_title = "Average Max Temp (°C)", "Top 10 Hottest Stations (Avg)"
+            data_values = df['Avg_Temp'].tolist()[-10:]
+        elif selected_metric == 'highest_temp':
+            df = df.sort_values('Highest_Temp', ascending=True)
+            chart_label, page_title = "Highest Recorded Temp (°C)", "Top 10 Extreme Heat Records"
+            data_values = df['Highest_Temp'].tolist()[-10:]
+        elif selected_metric == 'rain_days':
+            df = df.sort_values('Rain_Days', ascending=True)
+            chart_label, page_title = "Total Rainy Days (Count)", "Top 10 Most Frequent Rain"
+            data_values = df['Rain_Days'].tolist()[-10:]
+        else:
+            # Stations with no rainfall in the period (SUM is NULL) sort first, out of the top 10
+            df = df.sort_values('Total_Rainfall', ascending=True, na_position='first')
+            chart_label, page_title = "Total Rainfall (mm)", "Top 10 Wettest Stations (Volume)"
+            data_values = df['Total_Rainfall'].tolist()[-10:]
+        locations = df['Location_Name'].tolist()[-10:]
+    else:
+        locations, data_values, chart_label, page_title = [], [], "No Data", "Metric Viewer"
+
+    sel_rain = 'selected' if selected_metric == 'rain' else ''
+    sel_temp = 'selected' if selected_metric == 'temp' else ''
+    sel_high = 'selected' if selected_metric == 'highest_temp' else ''
+    sel_days = 'selected' if selected_metric == 'rain_days' else ''
+
+    content = f"""
+    <section class="hero"><h1>Metric Viewer</h1><p>{page_title}</p></section>
+    <div class="main-container" style="display: grid; grid-template-columns: 1fr 2fr; gap: 2rem; align-items: stretch;">
+        
+        <div class="glass-panel" style="padding: 3rem; display: flex; flex-direction: column; justify-content: center;">
+            <form action="/" method="get">
+                <input type="hidden" name="page" value="metrics">
+                <div class="form-group" style="margin-bottom: 2rem;">
+                    <label style="font-weight: 600; margin-bottom: 1rem; display: block;">Select Metric</label>
+                    <select name="metric" style="padding: 1rem; border-radius: 12px; width: 100%;">
+                        <option value="rain" {sel_rain}>Total Rainfall</option>
+                        <option value="rain_days" {sel_days}>Rainy Days</option>
+                        <option value="temp" {sel_temp}>Average Max Temp</option>
+                        <option value="highest_temp" {sel_high}>Highest Ever Temp</option>
+                    </select>
+                </div>
+                <div class="form-group" style="margin-bottom: 2rem;">
+                    {period_fields(form_data)}
+                    {coverage_filter_fields(coverage_filter)}
+                </div>
+                <button type="submit" class="btn-black" style="width: 100%;">Update Chart</button>
+            </form>
+        </div>
+
+        <div class="glass-panel" style="padding: 2.5rem; min-height: 500px; display: flex; align-items: center;">
+            <canvas id="metricChart"></canvas>
+        </div>
+    </div>
+
+    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <script>
+        const ctx = document.getElementById('metricChart').getContext('2d');
+        new Chart(ctx, {{
+            type: 'bar',
+            data: {{
+                labels: {locations}, 
+                datasets: [{{
+                    label: '{chart_label}', 
+                    data: {data_values},
+                    backgroundColor: '#ea580c', 
+                    borderRadius: 8,
+                    barThickness: 20,       // Sets the exact thickness
+                    maxBarThickness: 25     // Prevents stretching on large screens
+                }}]
+            }},
+            options: {{
+                indexAxis: 'y', 
+                responsive: true, 
+                maintainAspectRatio: false,
+                plugins: {{ legend: {{ display: false }} }},
+                scales: {{
+                    x: {{ grid: {{ display: true, color: 'rgba(0,0,0,0.05)' }} }},
+                    y: {{ grid: {{ display: false }} }}
+                }}
+            }}
+        }});
+    </script>
+    """
+    return content
+
+
+def similarity_page(form_data):
+    target_loc = form_data.get('target_loc', '').strip()
+    coverage_filter = read_coverage_filter(form_data)
+    start, end = read_period(form_data)
+    result_html = ""
+        
+    if target_loc:
+        conn = get_db_connection()
+        name_map = get_station_names()
+        states = ['VIC', 'NSW', 'QLD', 'WA', 'SA', 'TAS', 'NT']
+        try:
+            periods = {state: date_range_sql(conn, state, start, end) for state in states}
+        except PeriodError:
+            conn.close()
+            raise
+        
+        # IMPROVED: Try multiple ways to find the station
+        target_id = None
+        search_lower = target_loc.lower()
+        
+        # Method 1: Direct ID match
+        if target_loc in name_map:
+            target_id = target_loc
+        
+        # Method 2: Search by name (partial match)
+        if not target_id:
+            for sid, name in name_map.items():
+                if search_lower in name.lower():
+                    target_id = sid
+                    break
+        
+        # Method 3: Try using the input as-is (in case it's a valid ID not in weather_station)
+        if not target_id:
+            target_id = target_loc
+        
+        # Now search for temperature data
+        target_data = None
+        for state in states:
+            period_sql, period_params = periods[state]
+            try:
+                # Use parameterized query to avoid SQL injection
+                query = f"SELECT AVG(MaxTemp) as avg_temp FROM {state} WHERE CAST(Location AS TEXT) = ?{period_sql}"
+                res = pd.read_sql_query(query, conn, params=[str(target_id)] + period_params)
+                if not res.empty and res.iloc[0]['avg_temp'] is not None:
+                    # Get the display name
+                    display_name = name_map.get(str(target_id), f"Station {target_id}")
+                    target_data = {
+                        'temp': res.iloc[0]['avg_temp'],
+                        'name': display_name.title(),
+                        'id': target_id,
+                        'state': state
+                    }
+                    break
+            except Exception as e:
+                print(f"Error searching {state}: {e}")
+                continue
+            
+        if target_data:
+            # Find the closest match
+            df = apply_coverage_filter(get_station_summary(start, end), coverage_filter)
+            df['diff'] = abs(df['Avg_Temp'] - target_data['temp'])
+            # Filter out the target itself
+            candidates = df[df['Station_ID'] != str(target_data['id'])].sort_values('diff')
+            
+            if not candidates.empty:
+                match = candidates.iloc[0]
+                
+                result_html = f"""
+                <div style="margin-top: 2.5rem; padding: 2.5rem; background: #fff7ed; border-radius: 16px; color: #9a3412; border: 1px solid #fed7aa; text-align: center;">
+                    <h3 style="margin-bottom: 1rem; color: #ea580c;">Match Found!</h3>
+                    <p style="font-size: 1.1rem; margin-bottom: 1.5rem;">The station with the most similar profile to <strong>{target_data['name']}</strong> ({target_data['state']}) is:</p>
+                    <div style="font-size: 1.5rem; font-weight: 700; margin-bottom: 0.75rem;">{match['Location_Name']} ({match['State']})</div>
+                    <p>Both stations average around <strong>{match['Avg_Temp']:.1f}°C</strong></p>
+                    <p style="margin-top: 1rem; font-size: 0.9rem; color: #78350f;">Temperature difference: {match['diff']:.1f}°C</p>
+                </div>"""
+            else:
+                result_html = "<div class='glass-panel' style='margin-top:2rem; color:#ea580c; padding:1rem;'>Match found, but no similar stations available for comparison.</div>"
+        else:
+            # Provide helpful suggestions
+            sample_ids = list(name_map.keys())[:5]
+            sample_names = [f"{name_map[sid].title()} ({sid})" for sid in sample_ids]
+            
+            result_html = f"""
+            <div class='glass-panel' style='margin-top:2rem; padding:2rem; border: 2px solid #fee2e2;'>
+                <p style='color:#dc2626; font-weight:600; margin-bottom:1rem;'>Station '{target_loc}' not found in database.</p>
+                <p style='color:#6b7280; margin-bottom:1rem;'>Please try:</p>
+                <ul style='color:#6b7280; text-align:left; margin-left:2rem; line-height:1.8;'>
+                    <li>Using a station ID from the <a href="?page=data" style="color:#ea580c;">Data page</a></li>
+                    <li>Entering part of a station name (e.g., "Melbourne", "Brisbane")</li>
+                </ul>
+                <p style='color:#9ca3af; font-size:0.9rem; margin-top:1.5rem;'>Examples: {', '.join(sample_names[:3])}</p>
+            </div>"""
+        conn.close()
+                        
+    content = f"""
+    <section class="hero"><h1>Similarity Check</h1><p>Compare historical climate profiles across Australia.</p></section>
+    <div class="main-container" style="display: grid; grid-template-columns: 1fr 1fr; gap: 4rem; align-items: stretch;">
+        <div class="glass-panel" style="padding: 4rem; text-align: center; display: flex; flex-direction: column; justify-content: center;">
+            <h3 style="margin-bottom: 1.5rem; font-size: 1.6rem;">Find your Climate Twin</h3>
+            <p style="color: #4b5563; line-height: 1.8; margin-bottom: 2.5rem; max-width: 400px; margin-left: auto; margin-right: auto;">Our engine analyzes historical temperature patterns to find your city's match.</p>
+            <div style="margin-bottom: 2rem;">
+                <h4 style="font-size: 1rem; color: #ea580c; margin-bottom: 1.5rem; text-transform: uppercase;">Use Cases</h4>
+                <ul style="list-style: none; padding: 0; color: #555; line-height: 3; display: inline-block; text-align: left;">
+                    <li style="display: flex; align-items: center; gap: 15px;"><i data-lucide="leaf" style="width: 20px; height: 20px; color: #111;"></i> <strong>Gardening:</strong> Find matching thrive zones.</li>
+                    <li style="display: flex; align-items: center; gap: 15px;"><i data-lucide="truck" style="width: 20px; height: 20px; color: #111;"></i> <strong>Relocation:</strong> Discover weather you love.</li>
+                    <li style="display: flex; align-items: center; gap: 15px;"><i data-lucide="bar-chart-3" style="width: 20px; height: 20px; color: #111;"></i> <strong>Research:</strong> Compare microclimates.</li>
+                </ul>
+            </div>
+        </div>
+        <div class="glass-panel" style="padding: 4rem; text-align: center; display: flex; flex-direction: column; justify-content: center;">
+            <form action="/" method="get">
+                <input type="hidden" name="page" value="similarity">
+                <div class="form-group" style="margin-bottom: 2rem;">
+                    <label style="margin-bottom: 1.25rem; display: block; font-weight: 600;">Target Station (Name or ID)</label>
+                    <input type="text" name="target_loc" placeholder="e.g. Sydney" value="{target_loc if target_loc else ''}" required style="font-size: 1.1rem; padding: 1.2rem; width: 100%;">
+                </div>
+                <div class="form-group" style="margin-bottom: 2rem;">
+                    {period_fields(form_data)}
+                    {coverage_filter_fields(coverage_filter)}
+                </div>
+                <button type="submit" class="btn-black" style="margin: 0 auto;">Run Analysis</button>
+            </form>
+            {result_html}
+        </div>
+    </div>"""
+    return content
+
+
+def compare_page(form_data):
+    selected_state = str(form_data.get('state', 'VIC')).strip().upper()
+    selected_metric = form_data.get('metric', 'corr')
+    raw_stations = form_data.get('stations', '').strip()
+    station_ids = [s.strip() for s in raw_stations.split(',') if s.strip()]
+    coverage_filter = read_coverage_filter(form_data)
+    heatmap_html = ""
+
+    if selected_state in STATES:
+        station_ids = coverage_filtered_ids(selected_state, station_ids, coverage_filter)
+        result, stations = get_station_comparison(selected_state, station_ids, selected_metric, *read_period(form_data))
+        if result is not None and not has_comparable_pairs(result):
+            heatmap_html = "<div class='glass-panel' style='margin-top:2rem; color:#ea580c; padding:1rem;'>Period too short to compare - no two stations share enough days in it.</div>"
+        elif result is not None:
+            name_map = get_station_names()
+            labels = [f"{name_map.get(sid, sid).title()} ({sid})" for sid in stations]
+            matrix_json = json.dumps(np.where(np.isnan(result), None, np.round(result, 3)).tolist())
+            json_link = f"/compare?{urlencode({k: v for k, v in form_data.items() if k != 'page'})}"
+
+            # Drawn on a canvas rather than as table cells - a few hundred stations is 100k+ cells
+            heatmap_html = f"""
+            <div class="glass-panel" style="padding: 2rem; margin-top: 2rem;">
+                <p style="color:#6b7280; margin-bottom:1rem;">{len(stations)} stations · daily MaxTemp anomalies · <span id="cellInfo">hover a cell for the value</span> · <a href="{json_link}" style="color:#ea580c;">Download JSON</a></p>
+                <div style="overflow: auto; max-height: 800px;"><canvas id="heatmap"></canvas></div>
+            </div>
+            <script>
+                const labels = {json.dumps(labels)};
+                const matrix = {matrix_json};
+                const isDistance = {'true' if selected_metric == 'dist' else 'false'};
+                const n = labels.length;
+                const cell = Math.max(4, Math.min(24, Math.floor(800 / n)));
+                const canvas = document.getElementById('heatmap');
+                canvas.width = canvas.height = n * cell;
+                const hctx = canvas.getContext('2d');
+                const maxValue = {max(float(np.nanmax(result)), 1e-9)};
+
+                // Corr: stronger colour = more alike. Dist: stronger colour = closer together.
+                for (let i = 0; i < n; i++) {{
+                    for (let j = 0; j < n; j++) {{
+                        const v = matrix[i][j];
+                        const strength = v === null ? 0 : (isDistance ? 1 - v / maxValue : Math.max(0, v));
+                        hctx.fillStyle = v === null ? '#f3f4f6' : `rgba(234, 88, 12, ${{strength.toFixed(2)}})`;
+                        hctx.fillRect(j * cell, i * cell, cell - (cell > 6 ? 1 : 0), cell - (cell > 6 ? 1 : 0));
+                    }}
+                }}
+                canvas.addEventListener('mousemove', (e) => {{
+                    const i = Math.floor(e.offsetY / cell), j = Math.floor(e.offsetX / cell);
+                    if (i >= n || j >= n) return;
+                    const v = matrix[i][j];
+                    const text = v === null ? 'not enough overlap' : (isDistance ? v.toFixed(1) + '°C' : v.toFixed(2));
+                    document.getElementById('cellInfo').textContent = `${{labels[i]}} vs ${{labels[j]}}: ${{text}}`;
+                }});
+            </script>"""
+        else:
+            heatmap_html = f"<div class='glass-panel' style='margin-top:2rem; color:#ea580c; padding:1rem;'>Not enough station data in {selected_state} to compare.</div>"
+
+    state_options = "".join(f"<option value='{s}' {'selected' if s == selected_state else ''}>{s}</option>" for s in STATES)
+    sel_corr = 'selected' if selected_metric != 'dist' else ''
+    sel_dist = 'selected' if selected_metric == 'dist' else ''
+
+    content = f"""
+    <section class="hero"><h1>Station Compare</h1><p>How closely do day-to-day temperature swings line up between stations?</p></section>
+    <div class="main-container">
+        <div class="glass-panel" style="padding: 2rem;">
+            <form action="/" method="get" style="display: grid; grid-template-columns: 1fr 1fr 2fr auto; gap: 1.5rem; align-items: end;">
+                <input type="hidden" name="page" value="compare">
+                <div class="form-group" style="margin-bottom: 0;"><label>State</label><select name="state">{state_options}</select></div>
+                <div class="form-group" style="margin-bottom: 0;"><label>Measure</label>
+                    <select name="metric">
+                        <option value="corr" {sel_corr}>Anomaly Correlation</option>
+                        <option value="dist" {sel_dist}>Anomaly Distance (RMS)</option>
+                    </select>
+                </div>
+                <div class="form-group" style="margin-bottom: 0;"><label>Stations (optional, comma-separated IDs)</label><input type="text" name="stations" value="{escape(raw_stations)}" placeholder="All stations in the state"></div>
+                <button type="submit" class="btn-black">Compare</button>
+                <div style="grid-column: 1 / -1; display: flex; gap: 2rem; flex-wrap: wrap;">{period_fields(form_data)}{coverage_filter_fields(coverage_filter)}</div>
+            </form>
+        </div>
+        {heatmap_html}
+    </div>"""
+    return content
@@ -0,0 +1,19 @@
+"""Add the indexed integer Date_Key (YYYYMMDD) column to every state table.
+
+Run once against Climate_Data.db (re-running just refreshes the values):
+
+    python migrate_dates.py
+
+It also installs AFTER INSERT / UPDATE OF DMY triggers that fill Date_Key for rows
+loaded later. If a table holds DMY values that aren't D/M/YYYY the trigger is
+skipped (the script says which) and the script must be re-run after every load
+into that table - rows without a Date_Key drop out of period-filtered results.
+"""
+import time
+
+from climate.data import migrate_date_keys
+
+if __name__ == '__main__':
+    started = time.perf_counter()
+    migrated = migrate_date_keys()
+    print(f"Added Date_Key to {', '.join(migrated) or 'no tables'} in {time.perf_counter() - started:.1f}s")